@@ -1,16 +1,19 @@
-import json, re
+import re
+import orjson
 from pathlib import Path
 
 SUBNETS_JSON = Path("data/subnets.json")
 DESC_DIR = Path("data/descriptions")
 OUT_DIR  = Path("data/profiles"); OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-def slug(s):
-    return re.sub(r'[^a-z0-9]+','-', s.lower()).strip('-')
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
 
-TEMPLATE = """# {name} (Subnet {sid})
-**Primary Function:** {function}
+def slug(s):
+    return _SLUG_RE.sub('-', s.lower()).strip('-')
 
+# Only the heading and Primary Function vary per subnet; the rest of the
+# profile is formatted once from these baseline values.
+TAIL_TEMPLATE = """
 **Problem It Solves:** {problem}
 
 **Target Audience:** 
@@ -31,29 +34,34 @@ TEMPLATE = """# {name} (Subnet {sid})
 **Official Link:** {link}
 """
 
+# baseline scaffold; your front-end Agent will refine these live
+STATIC_TAIL = TAIL_TEMPLATE.format(
+    problem="TBD (auto-fill by live agent or add rules).",
+    aud1="Developers / users of this subnet",
+    aud2="Investors tracking Bittensor subnets",
+    growth="7", growth_reason="baseline; refined by live market signals.",
+    st="50", st_reason="baseline; sentiment will update live.",
+    mt="60", mt_reason="baseline; dev progress updates live.",
+    lt="70", lt_reason="baseline; macro fit updates live.",
+    conv="55", conv_reason="baseline synthesis of fundamentals + sentiment.",
+    trend="Checked by live agent.",
+    link="(website or X will be attached by live agent)"
+)
+
 def main():
-    data = json.loads(SUBNETS_JSON.read_text() or '{"subnets": []}')
+    data = orjson.loads(SUBNETS_JSON.read_bytes() or b'{"subnets": []}')
     for s in data.get("subnets", []):
         sid, name = s["id"], s["name"]
         desc_path = DESC_DIR / f"{sid}.md"
         function_txt = (desc_path.read_text().strip() if desc_path.exists() else
                         "Description not yet available; will update soon.")
-        # baseline scaffold; your front-end Agent will refine these live
-        content = TEMPLATE.format(
-            name=name, sid=sid,
-            function=function_txt,
-            problem="TBD (auto-fill by live agent or add rules).",
-            aud1="Developers / users of this subnet",
-            aud2="Investors tracking Bittensor subnets",
-            growth="7", growth_reason="baseline; refined by live market signals.",
-            st="50", st_reason="baseline; sentiment will update live.",
-            mt="60", mt_reason="baseline; dev progress updates live.",
-            lt="70", lt_reason="baseline; macro fit updates live.",
-            conv="55", conv_reason="baseline synthesis of fundamentals + sentiment.",
-            trend="Checked by live agent.",
-            link="(website or X will be attached by live agent)"
-        )
-        OUT_DIR.joinpath(f"{sid}_{slug(name)}.md").write_text(content)
+        content = f"# {name} (Subnet {sid})\n**Primary Function:** {function_txt}\n{STATIC_TAIL}"
+        out = OUT_DIR.joinpath(f"{sid}_{slug(name)}.md")
+        new = content.encode()
+        # leave unchanged profiles untouched so mtimes (and the embedding cache) stay valid
+        if out.exists() and out.read_bytes() == new:
+            continue
+        out.write_bytes(new)
 
 if __name__ == "__main__":
     main()
@@ -17,9 +17,11 @@ SUBNETS_JSON = Path("data/subnets.json")
 OUT_DIR = Path("data/profiles")
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
 def slug(text: str) -> str:
     """Convert text to URL-friendly slug."""
-    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+    return _SLUG_RE.sub('-', text.lower()).strip('-')
 
 def format_number(value: Any) -> str:
     """Format numbers for display."""
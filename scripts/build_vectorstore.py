@@ -1,25 +1,107 @@
-import json, glob
+import hashlib, os
 from pathlib import Path
-from sentence_transformers import SentenceTransformer
+import numpy as np
+import orjson
+from model2vec import StaticModel
+import bm25s
 import faiss
 
-FILES = sorted(glob.glob("data/profiles/*.md"))
-model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+# Static (distilled) embeddings: a token lookup + mean, no Transformer pass
+MODEL_NAME = "minishlab/potion-base-8M"
+PROFILES_DIR = "data/profiles"
 
-texts, ids = [], []
-for path in FILES:
-    t = Path(path).read_text()
-    texts.append(t); ids.append(path)
+# Embedding cache: rows in the .npz, path -> {mtime, sha1, row} in the .json
+CACHE_EMB = Path("vector/emb_cache.npz")
+CACHE_META = Path("vector/emb_cache.json")
+
+# Lexical index saved next to index.faiss for hybrid (BM25 + dense) retrieval
+BM25_DIR = "vector/bm25"
+
+# Corpus sizes above which the flat index gives way to compressed IVF indexes
+IVFPQ_MIN = 256
+OPQ_MIN = 64 * 39  # enough points to train 64 coarse cells
+
+def build_index(emb):
+    n, d = emb.shape
+    if n >= OPQ_MIN:
+        index = faiss.index_factory(d, "OPQ16,IVF64,PQ16", faiss.METRIC_INNER_PRODUCT)
+        index.train(emb)
+        faiss.extract_index_ivf(index).nprobe = 8
+    elif n >= IVFPQ_MIN:
+        quantizer = faiss.IndexFlatIP(d)
+        index = faiss.IndexIVFPQ(quantizer, d, min(64, n // 4), 16, 8,
+                                 faiss.METRIC_INNER_PRODUCT)
+        index.train(emb)
+        index.nprobe = 8
+    else:
+        index = faiss.IndexFlatIP(d)
+    index.add(emb)
+    return index
+
+def load_cache():
+    if not (CACHE_EMB.exists() and CACHE_META.exists()):
+        return {}, None
+    meta = orjson.loads(CACHE_META.read_bytes())
+    if meta.get("model") != MODEL_NAME:
+        return {}, None
+    return meta.get("files", {}), np.load(CACHE_EMB)["emb"]
+
+def save_cache(emb, ids, keys):
+    files = {path: {"mtime": mtime, "sha1": sha1, "row": row}
+             for row, (path, (mtime, sha1)) in enumerate(zip(ids, keys))}
+    np.savez(CACHE_EMB, emb=emb)
+    CACHE_META.write_bytes(orjson.dumps({"model": MODEL_NAME, "files": files}, option=orjson.OPT_INDENT_2))
+
+def read_entry(entry):
+    with open(entry.path, "rb") as f:
+        raw = f.read()
+    return raw.decode("utf-8"), (entry.stat().st_mtime, hashlib.sha1(raw).hexdigest())
+
+# One directory listing instead of glob + per-file Path stat/open
+entries = []
+if os.path.isdir(PROFILES_DIR):
+    with os.scandir(PROFILES_DIR) as it:
+        entries = sorted((e for e in it if e.name.endswith(".md") and e.is_file()), key=lambda e: e.name)
+
+texts, ids, keys = [], [], []
+for entry in entries:
+    t, key = read_entry(entry)
+    texts.append(t); ids.append(entry.path); keys.append(key)
 
 if not texts:
     Path("vector").mkdir(parents=True, exist_ok=True)
-    Path("vector/meta.json").write_text(json.dumps({"files": []}, indent=2))
+    Path("vector/meta.json").write_bytes(orjson.dumps({"files": []}, option=orjson.OPT_INDENT_2))
     print("No profiles yet.")
 else:
-    emb = model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
-    index = faiss.IndexFlatIP(emb.shape[1])
-    index.add(emb)
+    cached, cached_emb = load_cache()
+    rows, misses = [None] * len(texts), []
+    for i, (path, key) in enumerate(zip(ids, keys)):
+        entry = cached.get(path)
+        if entry and (entry["mtime"], entry["sha1"]) == key:
+            rows[i] = cached_emb[entry["row"]]
+        else:
+            misses.append(i)
+    if misses:
+        # Only load the model when something actually needs encoding
+        model = StaticModel.from_pretrained(MODEL_NAME)
+        new = np.ascontiguousarray(model.encode([texts[i] for i in misses], batch_size=64),
+                                   dtype=np.float32)
+        # Unit-normalize in place so inner product stays cosine for IndexFlatIP
+        faiss.normalize_L2(new)
+        for i, vec in zip(misses, new):
+            rows[i] = vec
+    # FAISS wants C-contiguous float32; anything else costs a hidden copy
+    emb = np.ascontiguousarray(np.stack(rows), dtype=np.float32)
+    index = build_index(emb)
     Path("vector").mkdir(parents=True, exist_ok=True)
     faiss.write_index(index, "vector/index.faiss")
-    Path("vector/meta.json").write_text(json.dumps({"files": ids}, indent=2))
-    print(f"Indexed {len(ids)} profiles.")
+    bm25 = bm25s.BM25()
+    bm25.index(bm25s.tokenize(texts, stopwords="en"))
+    bm25.save(BM25_DIR)
+    # index_type/mmap_safe tell scripts/load_vectorstore.py how to open the index:
+    # flat codes (IO_FLAG_MMAP_IFC) and IVF lists (IO_FLAG_MMAP) can be memory-mapped
+    meta = {"files": ids, "index_type": type(index).__name__,
+            "mmap_safe": isinstance(index, (faiss.IndexFlat, faiss.IndexIVF))}
+    Path("vector/meta.json").write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+    save_cache(emb, ids, keys)
+    print(f"Indexed {len(ids)} profiles ({len(misses)} encoded, {len(ids) - len(misses)} cached).")
@@ -8,6 +8,13 @@ This script helps identify the exact OpenAI SDK version and available API method
 import os
 import sys
 
+# Pre-1.0 module-level API classes whose presence indicates the legacy interface
+LEGACY_API_CLASSES = ("ChatCompletion", "Completion", "Embedding", "File", "FineTune", "Model")
+
+def public_attrs(obj):
+    """Return the public attribute names of obj (one dir() walk)."""
+    return tuple(attr for attr in dir(obj) if not attr.startswith('_'))
+
 def debug_openai_sdk():
     """Debug OpenAI SDK version and API structure."""
     
@@ -34,7 +41,7 @@ def debug_openai_sdk():
     
     # Check available attributes
     print(f"\n🔍 OpenAI module attributes:")
-    attrs = [attr for attr in dir(openai) if not attr.startswith('_')]
+    attrs = public_attrs(openai)
     for attr in attrs[:20]:  # Show first 20
         print(f"   - {attr}")
     if len(attrs) > 20:
@@ -51,27 +58,29 @@ def debug_openai_sdk():
         
         # Check client attributes
         print(f"   Client type: {type(client)}")
-        client_attrs = [attr for attr in dir(client) if not attr.startswith('_')]
-        print(f"   Client attributes: {client_attrs[:10]}...")
+        client_attrs = public_attrs(client)
+        print(f"   Client attributes: {list(client_attrs[:10])}...")
+        
+        # Walk each resource once and reuse the names below
+        files = getattr(client, 'files', None)
+        vector_stores = getattr(client, 'vector_stores', None)
+        vector_store_files = getattr(vector_stores, 'files', None)
         
         # Check for files API
-        if hasattr(client, 'files'):
+        if files is not None:
             print("✅ client.files exists")
-            files_attrs = [attr for attr in dir(client.files) if not attr.startswith('_')]
-            print(f"   files attributes: {files_attrs}")
+            print(f"   files attributes: {list(public_attrs(files))}")
         else:
             print("❌ client.files does not exist")
             
         # Check for vector_stores API
-        if hasattr(client, 'vector_stores'):
+        if vector_stores is not None:
             print("✅ client.vector_stores exists")
-            vs_attrs = [attr for attr in dir(client.vector_stores) if not attr.startswith('_')]
-            print(f"   vector_stores attributes: {vs_attrs}")
+            print(f"   vector_stores attributes: {list(public_attrs(vector_stores))}")
             
-            if hasattr(client.vector_stores, 'files'):
+            if vector_store_files is not None:
                 print("✅ client.vector_stores.files exists")
-                vs_files_attrs = [attr for attr in dir(client.vector_stores.files) if not attr.startswith('_')]
-                print(f"   vector_stores.files attributes: {vs_files_attrs}")
+                print(f"   vector_stores.files attributes: {list(public_attrs(vector_store_files))}")
             else:
                 print("❌ client.vector_stores.files does not exist")
         else:
@@ -87,7 +96,7 @@ def debug_openai_sdk():
         print("✅ Legacy OpenAI client configured")
         
         # Check legacy attributes
-        legacy_attrs = [attr for attr in dir(openai) if not attr.startswith('_') and attr[0].isupper()]
+        legacy_attrs = [attr for attr in LEGACY_API_CLASSES if attr in attrs]
         print(f"   Legacy API classes: {legacy_attrs}")
         
     except Exception as e:
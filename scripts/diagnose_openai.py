@@ -6,10 +6,33 @@ This script helps diagnose common issues with OpenAI vector store connections.
 Run this locally to test your setup before using it in GitHub Actions.
 """
 
+import asyncio
 import os
 import sys
+import time
 from pathlib import Path
 
+# Maximum number of uploads in flight at once (keeps us under rate limits)
+MAX_CONCURRENT_UPLOADS = 8
+
+async def upload_files_concurrently(api_key, vector_store_id, file_paths, max_concurrency=MAX_CONCURRENT_UPLOADS):
+    """Upload several files to a vector store concurrently."""
+    from openai import AsyncOpenAI
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    # async with closes the client's connection pool once the uploads finish
+    async with AsyncOpenAI(api_key=api_key) as client:
+        async def upload(path):
+            async with semaphore:
+                with open(path, "rb") as f:
+                    return await client.vector_stores.files.upload_and_poll(
+                        vector_store_id=vector_store_id,
+                        file=f
+                    )
+        
+        return await asyncio.gather(*(upload(path) for path in file_paths))
+
 def test_openai_connection():
     """Test OpenAI connection and vector store access."""
     
@@ -84,15 +107,18 @@ def test_openai_connection():
         with open(test_file_path, "w") as f:
             f.write(test_content)
         
-        with open(test_file_path, "rb") as f:
-            file_object = client.vector_stores.files.upload_and_poll(
-                vector_store_id=vector_store_id,
-                file=f
-            )
+        test_files = [test_file_path]
+        started = time.perf_counter()
+        file_objects = asyncio.run(upload_files_concurrently(api_key, vector_store_id, test_files))
+        elapsed = time.perf_counter() - started
+        total_bytes = sum(os.path.getsize(path) for path in test_files)
         
-        print(f"✅ Test file uploaded successfully!")
-        print(f"📁 File ID: {file_object.id}")
-        print(f"📊 Status: {file_object.status}")
+        for file_object in file_objects:
+            print(f"✅ Test file uploaded successfully!")
+            print(f"📁 File ID: {file_object.id}")
+            print(f"📊 Status: {file_object.status}")
+        print(f"⏱️ Upload throughput: {len(file_objects) / elapsed:.2f} files/s, "
+              f"{total_bytes / elapsed:.0f} bytes/s ({elapsed:.2f}s total)")
         
         # Clean up test file
         os.remove(test_file_path)
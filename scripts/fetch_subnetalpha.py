@@ -1,6 +1,10 @@
-import json, re, time
+import asyncio, functools, json, re, time
+from io import BytesIO
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
 from pathlib import Path
 
 SUBNETS = Path("data/subnets.json")
@@ -12,29 +16,79 @@ INDEX_URLS = [
     "https://subnetalpha.ai/",
 ]
 
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; bittensor-subnet-updater)",
+    "Accept-Encoding": "gzip",
+}
+
+# Shared keep-alive session so repeated index fetches reuse one TLS connection
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+_P_XPATH = etree.XPath("(//p)[position()<=3]")
+
+def _text(el):
+    # Space between child texts so adjacent elements don't run together, like get_text(" ", strip=True)
+    return " ".join(" ".join(el.itertext()).split())
+
+@functools.lru_cache(maxsize=4)
+def load_index_cards(index_url):
+    """Fetch an index page once and return its ((card_text_lower, href), ...) table."""
+    page = _SESSION.get(index_url, timeout=30).content
+    cards = []
+    # Stream the page and free every element once it ends, dropping finished
+    # earlier siblings too, so the tree never grows past the open path.
+    # Inside an <a> nothing is freed until the anchor ends and its text is read.
+    in_anchor = 0
+    for event, el in etree.iterparse(BytesIO(page), events=("start", "end"), html=True):
+        if el.tag == "a":
+            if event == "start":
+                in_anchor += 1
+                continue
+            in_anchor -= 1
+            href = el.get("href", "")
+            if "/subnet/" in href:
+                cards.append((_text(el).lower(), href))
+        if event == "start" or in_anchor:
+            continue
+        el.clear(keep_tail=True)
+        while el.getprevious() is not None:
+            del el.getparent()[0]
+    return tuple(cards)
+
 def find_page(name:str):
     name_low = name.lower()
     for index_url in INDEX_URLS:
-        html = requests.get(index_url, timeout=30).text
-        soup = BeautifulSoup(html, "lxml")
-        for a in soup.select("a[href*='/subnet/']"):
-            card_text = a.get_text(" ", strip=True).lower()
+        for card_text, href in load_index_cards(index_url):
             if name_low in card_text:
-                href = a.get("href", "")
                 if href.startswith("http"):
                     return href
                 return "https://subnetalpha.ai" + href
     return None
 
-def extract_function_text(url):
-    html = requests.get(url, timeout=30).text
-    soup = BeautifulSoup(html, "lxml")
-    paras = soup.select("p")
-    text = "\n\n".join(p.get_text(" ", strip=True) for p in paras[:3]).strip()
+async def extract_function_text(session, url):
+    async with session.get(url) as resp:
+        resp.raise_for_status()
+        html = await resp.text()
+    doc = lxml_html.fromstring(html)
+    text = "\n\n".join(_text(p) for p in _P_XPATH(doc)).strip()
     return text
 
+async def fetch_function_texts(urls):
+    connector = aiohttp.TCPConnector(limit=32)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=HEADERS) as session:
+        # Failures come back as exception objects so one bad page doesn't lose the rest
+        return await asyncio.gather(*(extract_function_text(session, u) for u in urls),
+                                    return_exceptions=True)
+
 def main():
     subnets = json.loads(SUBNETS.read_text()).get("subnets", [])
+    pending = []
     for s in subnets:
         out = DESC_DIR / f"{s['id']}.md"
         if out.exists():  # keep prior description unless you want to overwrite
@@ -42,7 +96,15 @@ def main():
         page = find_page(s["name"])
         if not page:
             continue
-        txt = extract_function_text(page)
+        pending.append((out, page))
+    if not pending:
+        return
+    # one concurrent wave of description page fetches
+    texts = asyncio.run(fetch_function_texts([page for _, page in pending]))
+    for (out, page), txt in zip(pending, texts):
+        if isinstance(txt, BaseException):
+            print(f"⚠️ Skipping {page}: {txt!r}")
+            continue
         if txt:
             out.write_text(txt)
 
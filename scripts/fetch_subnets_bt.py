@@ -7,17 +7,100 @@ from the Bittensor blockchain (Finney network) using only public data.
 No credentials or private keys required.
 """
 
-import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import bittensor as bt
-from typing import Dict, List, Any
+import orjson
+from typing import Dict, List, Any, Optional
 
 # Output file
 OUT = Path("data/subnets.json")
 OUT.parent.mkdir(parents=True, exist_ok=True)
 
-def get_subnet_info(subtensor: bt.Subtensor, subnet_id: int) -> Dict[str, Any]:
+# Number of subnets fetched concurrently (each worker holds its own connection)
+MAX_WORKERS = 8
+
+_thread_local = threading.local()
+
+def get_thread_subtensor() -> bt.Subtensor:
+    """Return this thread's Subtensor; the underlying websocket is not thread-safe."""
+    if not hasattr(_thread_local, "subtensor"):
+        _thread_local.subtensor = bt.Subtensor(network="finney")
+    return _thread_local.subtensor
+
+# SubtensorModule storage maps (keyed by netuid) read in one batched query
+CHAIN_STATE_STORAGE = (
+    "NetworksAdded",
+    "FirstEmissionBlockNumber",
+    "SubnetOwnerHotkey",
+    "SubnetTAO",
+    "SubnetAlphaIn",
+)
+
+def fetch_chain_state(subtensor: bt.Subtensor, subnet_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Read existence, activity, owner and pool reserves for all subnets at once.
+    
+    Builds one storage key per (map, netuid) pair and resolves them all with a
+    single state_queryStorageAt call instead of several RPCs per subnet.
+    
+    Args:
+        subtensor: Bittensor Subtensor instance
+        subnet_ids: The subnet IDs to fetch state for
+        
+    Returns:
+        Dictionary mapping subnet ID to exists/is_active/owner_hotkey/price
+    """
+    substrate = subtensor.substrate
+    storage_keys = [
+        substrate.create_storage_key("SubtensorModule", storage_function, [subnet_id])
+        for subnet_id in subnet_ids
+        for storage_function in CHAIN_STATE_STORAGE
+    ]
+    
+    raw: Dict[int, Dict[str, Any]] = {subnet_id: {} for subnet_id in subnet_ids}
+    for storage_key, value in substrate.query_multi(storage_keys):
+        raw[storage_key.params[0]][storage_key.storage_function] = getattr(value, "value", value)
+    
+    state = {}
+    for subnet_id, values in raw.items():
+        tao_in = values.get("SubnetTAO") or 0
+        alpha_in = values.get("SubnetAlphaIn") or 0
+        if subnet_id == 0:
+            price = 1.0  # root network is priced 1:1 in TAO
+        else:
+            price = tao_in / alpha_in if alpha_in else 0
+        state[subnet_id] = {
+            "exists": bool(values.get("NetworksAdded")),
+            "is_active": bool(values.get("FirstEmissionBlockNumber")),
+            "owner_hotkey": values.get("SubnetOwnerHotkey"),
+            "price": float(price),
+        }
+    return state
+
+def error_record(subnet_id: int, error: Exception) -> Dict[str, Any]:
+    """Placeholder entry for a subnet whose data could not be fetched."""
+    print(f"Error fetching subnet {subnet_id}: {error}")
+    return {
+        "id": subnet_id,
+        "name": f"Subnet {subnet_id}",
+        "error": str(error),
+        "last_update": int(time.time())
+    }
+
+def fetch_subnet(subnet_id: int, chain_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Fetch one subnet on the calling worker thread's connection."""
+    try:
+        # Connecting can fail per worker; keep that to this subnet's record
+        subtensor = get_thread_subtensor()
+    except Exception as e:
+        return error_record(subnet_id, e)
+    return get_subnet_info(subtensor, subnet_id, chain_state)
+
+def get_subnet_info(subtensor: bt.Subtensor, subnet_id: int,
+                    chain_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Fetch basic subnet information from the Bittensor blockchain.
     Uses only public data - no credentials required.
@@ -25,13 +108,18 @@ def get_subnet_info(subtensor: bt.Subtensor, subnet_id: int) -> Dict[str, Any]:
     Args:
         subtensor: Bittensor Subtensor instance
         subnet_id: The subnet ID to fetch information for
+        chain_state: Pre-fetched entry from fetch_chain_state; when missing,
+            each field is queried individually
         
     Returns:
         Dictionary containing subnet information
     """
     try:
         # Check if subnet exists
-        subnet_exists = subtensor.subnet_exists(subnet_id)
+        if chain_state is not None:
+            subnet_exists = chain_state["exists"]
+        else:
+            subnet_exists = subtensor.subnet_exists(subnet_id)
         
         if not subnet_exists:
             return {
@@ -49,30 +137,12 @@ def get_subnet_info(subtensor: bt.Subtensor, subnet_id: int) -> Dict[str, Any]:
             "last_update": int(time.time())
         }
         
-        # Try to get additional information that might work
-        try:
-            # Check if subnet is active
-            is_active = subtensor.is_subnet_active(subnet_id)
-            data["is_active"] = is_active
-        except Exception as e:
-            data["is_active"] = None
-            data["is_active_error"] = str(e)
-        
-        try:
-            # Get subnet owner
-            subnet_owner = subtensor.get_subnet_owner_hotkey(subnet_id)
-            data["owner_hotkey"] = subnet_owner
-        except Exception as e:
-            data["owner_hotkey"] = None
-            data["owner_error"] = str(e)
-        
-        try:
-            # Get subnet price
-            subnet_price = subtensor.get_subnet_price(subnet_id)
-            data["price"] = float(subnet_price) if subnet_price else 0
-        except Exception as e:
-            data["price"] = None
-            data["price_error"] = str(e)
+        if chain_state is not None:
+            data["is_active"] = chain_state["is_active"]
+            data["owner_hotkey"] = chain_state["owner_hotkey"]
+            data["price"] = chain_state["price"]
+        else:
+            fetch_subnet_fields(subtensor, subnet_id, data)
         
         try:
             # Get subnet hyperparameters
@@ -89,13 +159,41 @@ def get_subnet_info(subtensor: bt.Subtensor, subnet_id: int) -> Dict[str, Any]:
         return data
         
     except Exception as e:
-        print(f"Error fetching subnet {subnet_id}: {e}")
-        return {
-            "id": subnet_id,
-            "name": f"Subnet {subnet_id}",
-            "error": str(e),
-            "last_update": int(time.time())
-        }
+        return error_record(subnet_id, e)
+
+def fetch_subnet_fields(subtensor: bt.Subtensor, subnet_id: int, data: Dict[str, Any]) -> None:
+    """Query activity, owner and price one RPC at a time (batch query fallback)."""
+    # Try to get additional information that might work
+    try:
+        # Check if subnet is active
+        is_active = subtensor.is_subnet_active(subnet_id)
+        data["is_active"] = is_active
+    except Exception as e:
+        data["is_active"] = None
+        data["is_active_error"] = str(e)
+    
+    try:
+        # Get subnet owner
+        subnet_owner = subtensor.get_subnet_owner_hotkey(subnet_id)
+        data["owner_hotkey"] = subnet_owner
+    except Exception as e:
+        data["owner_hotkey"] = None
+        data["owner_error"] = str(e)
+    
+    try:
+        # Get subnet price
+        subnet_price = subtensor.get_subnet_price(subnet_id)
+        data["price"] = float(subnet_price) if subnet_price else 0
+    except Exception as e:
+        data["price"] = None
+        data["price_error"] = str(e)
+
+def has_subnets(path: Path) -> bool:
+    """True when path already holds a subnets.json with at least one subnet."""
+    try:
+        return bool(orjson.loads(path.read_bytes()).get("subnets"))
+    except (OSError, orjson.JSONDecodeError, AttributeError):
+        return False
 
 def main():
     """Main function to fetch all subnet data from Bittensor blockchain."""
@@ -112,15 +210,24 @@ def main():
         subnet_ids = subtensor.get_subnets()
         print(f"Found {len(subnet_ids)} registered subnets")
         
-        # Fetch detailed information for each subnet
+        # Batch-read per-subnet chain state in a single storage query
+        try:
+            chain_states = fetch_chain_state(subtensor, subnet_ids)
+            print(f"Fetched chain state for {len(chain_states)} subnets in one query")
+        except Exception as e:
+            print(f"Batched chain state query failed, falling back to per-subnet RPCs: {e}")
+            chain_states = {}
+        
+        # Fetch detailed information for each subnet concurrently
         subnets_data = []
-        for i, subnet_id in enumerate(subnet_ids, 1):
-            print(f"Fetching subnet {subnet_id} ({i}/{len(subnet_ids)})...")
-            subnet_info = get_subnet_info(subtensor, subnet_id)
-            subnets_data.append(subnet_info)
-            
-            # Small delay to avoid overwhelming the network
-            time.sleep(0.1)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(fetch_subnet, subnet_id, chain_states.get(subnet_id)): subnet_id for subnet_id in subnet_ids}
+            for i, future in enumerate(as_completed(futures), 1):
+                print(f"Fetched subnet {futures[future]} ({i}/{len(subnet_ids)})")
+                subnets_data.append(future.result())
+        
+        # Keep output ordered by subnet ID regardless of completion order
+        subnets_data.sort(key=lambda s: s["id"])
         
         # Prepare final data structure
         output_data = {
@@ -133,7 +240,7 @@ def main():
         }
         
         # Save to file
-        OUT.write_text(json.dumps(output_data, indent=2))
+        OUT.write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
         print(f"\nSuccessfully fetched and saved {len(subnets_data)} subnets to {OUT}")
         
         # Print summary
@@ -149,6 +256,11 @@ def main():
         print("Please ensure you have a stable internet connection and the bittensor package is installed.")
         print("This script uses only public blockchain data and requires no credentials.")
         
+        # Keep the last good snapshot: the workflow commits whatever is in OUT
+        if has_subnets(OUT):
+            print(f"Keeping existing {OUT}")
+            return
+        
         # Save empty data structure on error
         error_data = {
             "subnets": [],
@@ -159,7 +271,7 @@ def main():
             "error": str(e),
             "note": "Data fetched using only public blockchain information - no credentials required"
         }
-        OUT.write_text(json.dumps(error_data, indent=2))
+        OUT.write_bytes(orjson.dumps(error_data, option=orjson.OPT_INDENT_2))
 
 if __name__ == "__main__":
     main()
@@ -6,302 +6,530 @@ This script fetches live subnet data from TaoMarketCap and uploads it to OpenAI
 Maintains compatibility with existing working OpenAI integration.
 """
 
-import requests
+import orjson
+import io
+import logging
 import os
 import datetime
 import re
 import sys
 from pathlib import Path
-from bs4 import BeautifulSoup
+from taomc_common import API_SUBNETS_URL, fetch_page
+
+try:
+    # SIMD-accelerated hash for the unchanged-snapshot check; blake2b otherwise
+    from blake3 import blake3 as content_hasher
+except ImportError:
+    from hashlib import blake2b as content_hasher
+
+try:
+    # Reads .txt.zst snapshots; writes them only when TAOMC_ZSTD_SNAPSHOTS=1
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger("taomc")
 
 # === CONFIG ===
 VECTOR_STORE_ID = "vs_68f441099ff88191a84e2e4dadfdc104"
 SNAPSHOT_DIR = "data/snapshots"
+TAOMARKETCAP_URL = "https://taomarketcap.com/"
+UTC = datetime.timezone.utc
+# Committed snapshots stay plain text so git can delta them and GitHub can show
+# them; zstd compression is opt-in for local runs that keep many snapshots
+COMPRESS_SNAPSHOTS = zstandard is not None and os.getenv("TAOMC_ZSTD_SNAPSHOTS") == "1"
+SNAPSHOT_EXT = ".txt.zst" if COMPRESS_SNAPSHOTS else ".txt"
+# Hash of the last uploaded snapshot data, committed with the snapshots
+LAST_HASH_FILE = os.path.join(SNAPSHOT_DIR, ".last_hash")
+
+# === PATTERNS === (bytes patterns run on the raw response body)
+_RE_NEXT_DATA = re.compile(rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+_RE_FIELDS = re.compile(rb'"(subnet|name|price|marketcap|volume|emission)":(?:"([^"]*)"|([-0-9.]+))')
+_RE_SUM = re.compile(rb'"sum_of_sn_prices_preview":\[.*?"value":([0-9.]+)')
+_RE_TRENDING = re.compile(rb'"subnets":\[(.*?)\]')
+_RE_SCRIPT_JSON = re.compile(r'"subnets":\s*\[(.*?)\]', re.DOTALL)
 
 def setup_directories():
     """Create necessary directories."""
     os.makedirs(SNAPSHOT_DIR, exist_ok=True)
-    print(f"📁 Created/verified directory: {SNAPSHOT_DIR}")
+    logger.info("📁 Created/verified directory: %s", SNAPSHOT_DIR)
+
+def extract_next_data(body):
+    """Decode the __NEXT_DATA__ JSON blob embedded in a Next.js page (bytes in)."""
+    match = _RE_NEXT_DATA.search(body)
+    if not match:
+        return None
+    try:
+        return orjson.loads(match.group(1))
+    except orjson.JSONDecodeError:
+        return None
+
+def find_many_in_json(node, predicates):
+    """
+    Return {name: value} for the first pair matching each named predicate.
+    
+    One depth-first walk over the tree, stopping as soon as every predicate
+    has matched; names that never match are absent.
+    """
+    found = {}
+    stack = [node]
+    while stack and len(found) < len(predicates):
+        item = stack.pop()
+        if isinstance(item, dict):
+            for key, value in item.items():
+                for name, predicate in predicates.items():
+                    if name not in found and predicate(key, value):
+                        found[name] = value
+                stack.append(value)
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+    return found
+
+def is_sum_preview(key, value):
+    """Match the "Sum of SN Prices" preview series."""
+    return key == "sum_of_sn_prices_preview"
+
+def is_trending_list(key, value):
+    """Match the list of trending subnet entities."""
+    return (key == "subnets" and isinstance(value, list)
+            and value and isinstance(value[0], dict) and "entity_id" in value[0])
+
+def is_subnet_list(key, value):
+    """Match the list of per-subnet market records."""
+    return (isinstance(value, list) and value
+            and all(isinstance(v, dict) and "subnet" in v and "price" in v for v in value))
+
+# Bound number formatters for the per-subnet table cells
+_fmt_usd6 = "${:.6f}".format
+_fmt_usd2 = "${:,.2f}".format
+_fmt_grouped = "{:,}".format
+_fmt6 = "{:.6f}".format
+
+# Record fields that are formatted as numbers in the snapshot table
+_NUMERIC_FIELDS = ("price", "marketcap", "volume", "circulating_supply", "emission")
+
+def is_valid_record(record):
+    """True when a decoded subnet record can be formatted without raising."""
+    return isinstance(record, dict) and all(
+        isinstance(record.get(field, 0), (int, float)) for field in _NUMERIC_FIELDS
+    )
+
+def subnets_from_records(records):
+    """Format decoded per-subnet records into snapshot rows."""
+    valid = [subnet for subnet in records if is_valid_record(subnet)]
+    if len(valid) != len(records):
+        logger.warning("⚠️ Skipped %s malformed subnet records", len(records) - len(valid))
+    
+    return [{
+        "id": subnet.get("subnet", "N/A"),
+        "name": subnet.get("name", "N/A"),
+        "price_usd": _fmt_usd6(subnet.get("price", 0)),
+        "market_cap": _fmt_usd2(subnet.get("marketcap", 0)),
+        "volume_24h": _fmt_usd2(subnet.get("volume", 0)),
+        "circulating_supply": _fmt_grouped(subnet.get("circulating_supply", 0)),
+        "emissions": _fmt6(subnet.get("emission", 0))
+    } for subnet in valid]
+
+def parse_next_data(next_data):
+    """Build snapshot data from a decoded __NEXT_DATA__ payload, or None."""
+    page_props = next_data.get("props", {}).get("pageProps", next_data)
+    # Records, price sum and trending list all come out of a single walk
+    found = find_many_in_json(page_props, {
+        "records": is_subnet_list,
+        "preview": is_sum_preview,
+        "trending": is_trending_list,
+    })
+    records = found.get("records")
+    if not records:
+        return None
+    
+    # Every record failing validation counts as a miss, so the regex fallback still runs
+    subnets = subnets_from_records(records)
+    if not subnets:
+        return None
+    
+    sum_sn_prices = "N/A"
+    preview = found.get("preview")
+    if isinstance(preview, list):
+        values = [item["value"] for item in preview if isinstance(item, dict) and "value" in item]
+        if values:
+            sum_sn_prices = f"${float(values[0]):.6f}"
+    
+    trending = [f"SN {item.get('entity_id', 'N/A')}" for item in (found.get("trending") or [])[:10]]
+    
+    return {
+        "subnets": subnets,
+        "sum_sn_prices": sum_sn_prices,
+        "trending": trending,
+    }
+
+def parse_main_page(body):
+    """Snapshot data from the page's __NEXT_DATA__ JSON, timestamped, or None."""
+    next_data = extract_next_data(body)
+    parsed = parse_next_data(next_data) if next_data else None
+    if parsed:
+        parsed["timestamp"] = datetime.datetime.now(UTC)
+    return parsed
+
+def scan_subnet_fields(body):
+    """
+    Collect per-subnet fields from raw page bytes in a single regex pass.
+    
+    A record starts at each numeric "subnet" key; the first occurrence of every
+    other field after it belongs to that record until the next "subnet" key.
+    """
+    records = []
+    current = None
+    for match in _RE_FIELDS.finditer(body):
+        field = match.group(1)
+        value = match.group(2) if match.group(2) is not None else match.group(3)
+        if field == b"subnet":
+            if not value.isdigit():
+                continue
+            current = {}
+            records.append(current)
+        if current is not None:
+            current.setdefault(field, value)
+    return records
+
+def parse_number(raw):
+    """Parse a scraped unsigned decimal, defaulting to 0.0."""
+    return float(raw) if raw and raw.replace(b'.', b'').isdigit() else 0.0
+
+def iter_script_texts(body):
+    """Yield the text of every <script> tag in an HTML page (bytes in)."""
+    # HTML parsers are imported here: only the script-tag fallback needs one
+    try:
+        # selectolax when installed; plain lxml otherwise (no per-tag soup objects)
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        from lxml import etree
+        # Every element is cleared when it ends and dropped from its parent
+        # along with any finished earlier siblings, so the tree never grows
+        # past the currently open path (as in fetch_subnetalpha.load_index_cards)
+        for _, el in etree.iterparse(io.BytesIO(body), events=("end",), html=True, encoding="utf-8"):
+            if el.tag == "script":
+                yield el.text
+            el.clear(keep_tail=True)
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+    else:
+        for node in HTMLParser(body).css("script"):
+            yield node.text()
+
+def fetch_from_api():
+    """Build snapshot data from the TaoMarketCap JSON API, or None."""
+    resp = fetch_page(API_SUBNETS_URL, "TaoMarketCap API")
+    if resp is None:
+        return None
+    try:
+        items = orjson.loads(resp.content)
+    except orjson.JSONDecodeError as e:
+        logger.warning("⚠️ TaoMarketCap API returned invalid JSON: %s", e)
+        return None
+    if not isinstance(items, list) or not items:
+        return None
+    
+    # Map API fields onto the record keys subnets_from_records expects
+    records = [{
+        "subnet": item.get("id", item.get("subnet", "N/A")),
+        # str(): the API schema is not documented, so don't assume a string
+        "name": str(item.get("name") or "N/A").strip(),
+        "price": item.get("price") or 0,
+        "marketcap": item.get("marketcap", item.get("market_cap")) or 0,
+        "volume": item.get("volume", item.get("volume_24h")) or 0,
+        "circulating_supply": item.get("circulating_supply") or 0,
+        "emission": item.get("emission") or 0,
+    } for item in items if isinstance(item, dict)]
+    subnets = subnets_from_records(records)
+    if not subnets:
+        return None
+    
+    prices = [record["price"] for record in records if is_valid_record(record)]
+    return {
+        "subnets": subnets,
+        "sum_sn_prices": _fmt_usd6(sum(prices)),
+        "trending": [],  # only published on the HTML page
+        "timestamp": datetime.datetime.now(UTC)
+    }
 
 def fetch_taomarketcap():
     """Fetch subnet data from TaoMarketCap website."""
-    print("🔍 Fetching data from TaoMarketCap...")
+    logger.info("🔍 Fetching data from TaoMarketCap...")
     
-    url = "https://taomarketcap.com/"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+    # Preferred: the JSON API, which needs no HTML parsing at all
+    parsed = fetch_from_api()
+    if parsed:
+        logger.info("📈 Processed %s subnets from the API", len(parsed['subnets']))
+        return parsed
     
-    try:
-        resp = requests.get(url, headers=headers, timeout=30)
-        resp.raise_for_status()
-        print(f"✅ Successfully fetched TaoMarketCap (status: {resp.status_code})")
-    except Exception as e:
-        print(f"❌ Error fetching TaoMarketCap: {e}")
+    resp = fetch_page(TAOMARKETCAP_URL)
+    if resp is None:
         return None
     
     # Extract JSON data from the page
-    print("🔍 Extracting subnet data from page...")
-    
-    # Extract each field individually using regex
-    subnet_ids = re.findall(r'"subnet":(\d+)', resp.text)
-    names = re.findall(r'"name":"([^"]*)"', resp.text)
-    prices = re.findall(r'"price":([0-9.]+)', resp.text)
-    marketcaps = re.findall(r'"marketcap":([0-9.]+)', resp.text)
-    volumes = re.findall(r'"volume":([0-9.]+)', resp.text)
-    emissions = re.findall(r'"emission":([0-9.]+)', resp.text)
-    
-    # Create matches from individual extractions
-    matches = []
-    for i in range(min(len(subnet_ids), len(names), len(prices), len(marketcaps), len(volumes), len(emissions))):
-        matches.append((subnet_ids[i], names[i], prices[i], marketcaps[i], volumes[i], emissions[i]))
-    
-    if not matches:
-        print("❌ Could not extract subnet data")
+    logger.info("🔍 Extracting subnet data from page...")
+    
+    # Next: decode the embedded page JSON once
+    parsed = parse_main_page(resp.content)
+    if parsed:
+        logger.info("📈 Processed %s subnets, %s trending items", len(parsed['subnets']), len(parsed['trending']))
+        return parsed
+    
+    # Fallback: scrape individual fields out of the raw page bytes
+    body = resp.content
+    records = scan_subnet_fields(body)
+    
+    if not records:
+        logger.error("❌ Could not extract subnet data")
         return None
     
-    print(f"📊 Found {len(matches)} subnet records")
+    logger.info("📊 Found %s subnet records", len(records))
     
-    # Process the subnet data
-    subnets = []
-    for match in matches:
-        try:
-            if len(match) >= 6:
-                subnet_id = match[0]
-                name = match[1] if len(match) > 1 else "Unknown"
-                price = float(match[2]) if len(match) > 2 and match[2].replace('.', '').isdigit() else 0.0
-                marketcap = float(match[3]) if len(match) > 3 and match[3].replace('.', '').isdigit() else 0.0
-                volume = float(match[4]) if len(match) > 4 and match[4].replace('.', '').isdigit() else 0.0
-                emission = float(match[5]) if len(match) > 5 and match[5].replace('.', '').isdigit() else 0.0
-                
-                subnets.append({
-                    "id": subnet_id,
-                    "name": name,
-                    "price_usd": f"${price:.6f}",
-                    "market_cap": f"${marketcap:,.2f}",
-                    "volume_24h": f"${volume:,.2f}",
-                    "circulating_supply": "N/A",  # We'll get this separately if needed
-                    "emissions": f"{emission:.6f}"
-                })
-        except Exception as e:
-            print(f"⚠️ Error processing subnet {match[0] if match else 'unknown'}: {e}")
-            continue
+    # Process the subnet data; scan_subnet_fields only opens a record at a
+    # numeric "subnet" key and parse_number never raises, so nothing here can fail
+    subnets = [{
+        "id": record[b"subnet"].decode(),
+        "name": record.get(b"name", b"Unknown").decode("utf-8", "replace"),
+        "price_usd": _fmt_usd6(parse_number(record.get(b"price"))),
+        "market_cap": _fmt_usd2(parse_number(record.get(b"marketcap"))),
+        "volume_24h": _fmt_usd2(parse_number(record.get(b"volume"))),
+        "circulating_supply": "N/A",  # We'll get this separately if needed
+        "emissions": _fmt6(parse_number(record.get(b"emission")))
+    } for record in records]
     
     # Extract summary statistics
     sum_sn_prices = "N/A"
     trending = []
     
     # Look for Sum of SN Prices
-    sum_match = re.search(r'"sum_of_sn_prices_preview":\[.*?"value":([0-9.]+)', resp.text)
+    sum_match = _RE_SUM.search(body)
     if sum_match:
         sum_sn_prices = f"${float(sum_match.group(1)):.6f}"
     
     # Look for trending subnets
-    trending_match = re.search(r'"subnets":\[(.*?)\]', resp.text)
+    trending_match = _RE_TRENDING.search(body)
     if trending_match:
         try:
-            trending_data = json.loads("[" + trending_match.group(1) + "]")
+            trending_data = orjson.loads(b"[" + trending_match.group(1) + b"]")
             trending = [f"SN {item.get('entity_id', 'N/A')}" for item in trending_data[:10]]
         except:
             trending = []
     
-    print(f"📈 Processed {len(subnets)} subnets, {len(trending)} trending items")
+    logger.info("📈 Processed %s subnets, %s trending items", len(subnets), len(trending))
     
     return {
         "subnets": subnets,
         "sum_sn_prices": sum_sn_prices,
         "trending": trending,
-        "timestamp": datetime.datetime.utcnow()
+        "timestamp": datetime.datetime.now(UTC)
     }
 
 def fetch_from_main_page():
     """Fallback method to fetch from main page."""
-    print("🔍 Fetching data from TaoMarketCap main page...")
-    
-    url = "https://taomarketcap.com/"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+    logger.info("🔍 Fetching data from TaoMarketCap main page...")
     
-    try:
-        resp = requests.get(url, headers=headers, timeout=30)
-        resp.raise_for_status()
-        print(f"✅ Successfully fetched TaoMarketCap main page (status: {resp.status_code})")
-    except Exception as e:
-        print(f"❌ Error fetching TaoMarketCap: {e}")
+    resp = fetch_page(TAOMARKETCAP_URL, "TaoMarketCap main page")
+    if resp is None:
         return None
     
-    # Parse the HTML to extract JSON data
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # Preferred: decode the embedded page JSON once
+    parsed = parse_main_page(resp.content)
+    if parsed:
+        logger.info("📈 Found %s subnets from main page", len(parsed['subnets']))
+        return parsed
     
-    # Look for the JSON data in script tags
+    # Fallback: look for the JSON data in script tags
     subnets_data = None
-    script_tags = soup.find_all("script")
     
-    for script in script_tags:
-        if script.string and "subnets" in script.string and "price" in script.string:
+    for script_content in iter_script_texts(resp.content):
+        if script_content and "subnets" in script_content and "price" in script_content:
             try:
-                # Extract JSON data from the script tag
-                script_content = script.string
                 # Find the JSON object containing subnet data
                 if "subnets" in script_content:
-                    # Look for the data structure
-                    import json
-                    import re
-                    
                     # Try to find JSON data patterns
-                    json_match = re.search(r'"subnets":\s*\[(.*?)\]', script_content, re.DOTALL)
+                    json_match = _RE_SCRIPT_JSON.search(script_content)
                     if json_match:
                         # Extract subnet data
                         subnets_json = "[" + json_match.group(1) + "]"
-                        subnets_data = json.loads(subnets_json)
+                        subnets_data = orjson.loads(subnets_json)
                         break
                         
             except Exception as e:
-                print(f"⚠️ Error parsing script data: {e}")
+                logger.debug("skip script tag: %s", e)
                 continue
     
     if not subnets_data:
-        print("⚠️ Could not extract JSON data from main page")
+        logger.warning("⚠️ Could not extract JSON data from main page")
         return None
     
     # Process the subnet data
-    subnets = []
-    for subnet in subnets_data:
-        try:
-            subnets.append({
-                "id": subnet.get("subnet", "N/A"),
-                "name": subnet.get("name", "N/A"),
-                "price_usd": f"${subnet.get('price', 0):.6f}",
-                "market_cap": f"${subnet.get('marketcap', 0):,.2f}",
-                "volume_24h": f"${subnet.get('volume', 0):,.2f}",
-                "circulating_supply": f"{subnet.get('circulating_supply', 0):,}",
-                "emissions": f"{subnet.get('emission', 0):.6f}"
-            })
-        except Exception as e:
-            print(f"⚠️ Error processing subnet {subnet.get('subnet', 'unknown')}: {e}")
-            continue
+    subnets = subnets_from_records(subnets_data)
     
-    print(f"📈 Found {len(subnets)} subnets from main page")
+    logger.info("📈 Found %s subnets from main page", len(subnets))
     
     return {
         "subnets": subnets,
         "sum_sn_prices": "N/A",
         "trending": [],
-        "timestamp": datetime.datetime.utcnow()
+        "timestamp": datetime.datetime.now(UTC)
     }
 
-def create_markdown_snapshot(data):
-    """Create markdown formatted snapshot."""
-    if not data:
-        return None
-    
+# One snapshot table row, filled straight from a subnet dict
+_ROW_FMT = "| {id} | {name} | {price_usd} | {market_cap} | {volume_24h} | {circulating_supply} | {emissions} |\n\n"
+
+def write_markdown_snapshot(data, f):
+    """Stream the markdown formatted snapshot into an open text file."""
     now = data["timestamp"].strftime("%Y-%m-%d %H:%M UTC")
-    md = [f"# TaoMarketCap Subnet Snapshot — {now}\n"]
+    f.write(f"# TaoMarketCap Subnet Snapshot — {now}\n\n")
     
     # Summary section
-    md.append("## Summary\n")
-    md.append(f"- **Sum of SN Prices:** {data['sum_sn_prices']}\n")
-    md.append(f"- **Total Subnets:** {len(data['subnets'])}\n")
-    md.append(f"- **Top Trending Subnets:** {', '.join(data['trending'][:10]) if data['trending'] else 'N/A'}\n")
+    f.write("## Summary\n\n")
+    f.write(f"- **Sum of SN Prices:** {data['sum_sn_prices']}\n\n")
+    f.write(f"- **Total Subnets:** {len(data['subnets'])}\n\n")
+    f.write(f"- **Top Trending Subnets:** {', '.join(data['trending'][:10]) if data['trending'] else 'N/A'}\n\n")
     
     # Subnet data table
-    md.append("\n## Subnet Data\n")
-    md.append("| ID | Name | Price (USD) | Market Cap | 24h Volume | Circulating Supply | Emissions |\n")
-    md.append("|----|------|-------------|-------------|-------------|-------------------|------------|\n")
-    
-    for sn in data["subnets"]:
-        md.append(f"| {sn['id']} | {sn['name']} | {sn['price_usd']} | {sn['market_cap']} | {sn['volume_24h']} | {sn['circulating_supply']} | {sn['emissions']} |\n")
+    f.write("\n## Subnet Data\n\n")
+    f.write("| ID | Name | Price (USD) | Market Cap | 24h Volume | Circulating Supply | Emissions |\n\n")
+    f.write("|----|------|-------------|-------------|-------------|-------------------|------------|\n\n")
+    f.write("".join(_ROW_FMT.format_map(sn) for sn in data["subnets"]))
     
     # Additional metadata
-    md.append(f"\n## Metadata\n")
-    md.append(f"- **Snapshot Time:** {now}\n")
-    md.append(f"- **Data Source:** https://taomarketcap.com/\n")
-    md.append(f"- **Vector Store ID:** {VECTOR_STORE_ID}\n")
-    
-    return "\n".join(md)
+    f.write("\n## Metadata\n\n")
+    f.write(f"- **Snapshot Time:** {now}\n\n")
+    f.write("- **Data Source:** https://taomarketcap.com/\n\n")
+    f.write(f"- **Vector Store ID:** {VECTOR_STORE_ID}\n")
 
-def save_snapshot(markdown_content):
-    """Save snapshot to file."""
-    if not markdown_content:
+def save_snapshot(data):
+    """Write the markdown snapshot for data to a new file."""
+    if not data:
         return None
     
-    timestamp = datetime.datetime.utcnow().strftime("%Y-%m-%d_%Hh")
-    filename = f"snapshot_{timestamp}.txt"
+    # Name the file from the same timestamp the markdown header uses
+    timestamp = data["timestamp"].strftime("%Y-%m-%d_%Hh")
+    filename = f"snapshot_{timestamp}{SNAPSHOT_EXT}"
     path = os.path.join(SNAPSHOT_DIR, filename)
     
+    # Write beside the target and rename over it, so a crash mid-write never
+    # leaves a truncated snapshot behind for the uploader to pick up
+    tmp = path + ".tmp"
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
-        print(f"✅ Saved snapshot: {path}")
+        with open(tmp, "wb") as raw:
+            stream = zstandard.ZstdCompressor(level=3).stream_writer(raw) if COMPRESS_SNAPSHOTS else raw
+            with io.TextIOWrapper(stream, encoding="utf-8", newline="\n") as f:
+                write_markdown_snapshot(data, f)
+        os.replace(tmp, path)
+        logger.info("✅ Saved snapshot: %s", path)
         return path
     except Exception as e:
-        print(f"❌ Error saving snapshot: {e}")
+        logger.error("❌ Error saving snapshot: %s", e)
         return None
 
+def read_snapshot(path):
+    """Return the plain markdown bytes of a saved snapshot (.txt or .txt.zst)."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(f"{path} is zstd-compressed; install zstandard to read it")
+        # decompressobj copes with frames written without a content size
+        return zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    return raw
+
+def snapshot_hash(data):
+    """Hash the scraped data, leaving out the timestamp so reruns compare equal."""
+    payload = {key: value for key, value in data.items() if key != "timestamp"}
+    return content_hasher(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def read_last_hash():
+    """Return the hash recorded by the last successful upload, or None."""
+    try:
+        with open(LAST_HASH_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def write_last_hash(digest):
+    """Record the hash of the snapshot that was just uploaded."""
+    with open(LAST_HASH_FILE, "w", encoding="utf-8") as f:
+        f.write(digest + "\n")
+
 def upload_to_vector_store(file_path):
     """Upload file to OpenAI vector store using existing working method."""
     if not file_path or not os.path.exists(file_path):
-        print("❌ No file to upload")
+        logger.error("❌ No file to upload")
         return False
     
-    print("🔍 Attempting to upload to OpenAI vector store...")
+    logger.info("🔍 Attempting to upload to OpenAI vector store...")
     
     # Check API key
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
-        print("❌ OPENAI_API_KEY environment variable not set")
+        logger.error("❌ OPENAI_API_KEY environment variable not set")
         return False
     
     try:
         # Use the same method that's working in the current system
         from openai import OpenAI
-        print("✅ Successfully imported OpenAI client")
+        logger.info("✅ Successfully imported OpenAI client")
         
-        client = OpenAI(api_key=api_key)
-        print("✅ Created OpenAI client")
+        # The SDK retries 408/409/429/5xx with jittered exponential backoff;
+        # auth and bad-request errors fail fast
+        client = OpenAI(api_key=api_key, max_retries=5)
+        logger.info("✅ Created OpenAI client")
         
-        # Show file content preview before upload
-        print("📄 File content preview (first 500 chars):")
-        with open(file_path, "r", encoding="utf-8") as f:
-            content_preview = f.read()[:500]
-            print(content_preview)
-            print("...")
+        # OpenAI needs plain text, so compressed snapshots are inflated in memory
+        content = read_snapshot(file_path)
+        upload_name = os.path.basename(file_path).removesuffix(".zst")
+        
+        # Show file content preview before upload (TAOMC_LOG=DEBUG)
+        if logger.isEnabledFor(logging.DEBUG):
+            content_preview = content[:2000].decode("utf-8", "ignore")[:500]
+            logger.debug("📄 File content preview (first 500 chars):\n%s\n...", content_preview)
         
         # Upload file using the working method
-        print("📤 Uploading file to OpenAI...")
-        with open(file_path, "rb") as f:
+        logger.info("📤 Uploading file to OpenAI...")
+        with io.BytesIO(content) as f:
+            # Explicit (name, file, type) tuple so the SDK sends a proper name
+            # and content type instead of guessing them
             file_response = client.files.create(
-                file=f,
+                file=(upload_name, f, "text/markdown"),
                 purpose="assistants"  # Back to assistants for vector store compatibility
             )
-            print(f"✅ File uploaded successfully with ID: {file_response.id}")
+            logger.info("✅ File uploaded successfully with ID: %s", file_response.id)
         
         # Add to vector store using the working method
-        print(f"🔍 Adding file to vector store: {VECTOR_STORE_ID}")
+        logger.info("🔍 Adding file to vector store: %s", VECTOR_STORE_ID)
         try:
             vector_store_file = client.vector_stores.files.create(
                 vector_store_id=VECTOR_STORE_ID,
                 file_id=file_response.id
             )
-            print(f"✅ File added to vector store successfully!")
-            print(f"📁 Vector store file ID: {vector_store_file.id}")
+            logger.info("✅ File added to vector store successfully!")
+            logger.info("📁 Vector store file ID: %s", vector_store_file.id)
             return True
             
         except Exception as e:
-            print(f"⚠️ Vector store upload failed: {e}")
-            print("✅ File uploaded to OpenAI successfully, but vector store addition failed")
-            print("💡 This might be due to vector store permissions or the file being too large")
+            logger.warning("⚠️ Vector store upload failed: %s", e)
+            logger.info("✅ File uploaded to OpenAI successfully, but vector store addition failed")
+            logger.info("💡 This might be due to vector store permissions or the file being too large")
             return True  # Still consider this a success since file was uploaded
             
     except Exception as e:
-        print(f"❌ Error uploading to OpenAI: {e}")
+        logger.error("❌ Error uploading to OpenAI: %s", e)
         return False
 
 def main():
     """Main function."""
-    print("🚀 TaoMarketCap Subnet Snapshot Fetcher")
-    print("=" * 50)
+    log_level = os.environ.get("TAOMC_LOG", "INFO").strip().upper()
+    # getLevelName maps known names to their number; anything else falls back to INFO
+    level = logging.getLevelName(log_level)
+    logging.basicConfig(level=level if isinstance(level, int) else logging.INFO, format="%(message)s")
+    if not isinstance(level, int):
+        logger.warning("⚠️ Unknown TAOMC_LOG level %r, using INFO", log_level)
+    logger.info("🚀 TaoMarketCap Subnet Snapshot Fetcher")
+    logger.info("=" * 50)
     
     try:
         # Setup
@@ -310,37 +538,36 @@ def main():
         # Fetch data
         data = fetch_taomarketcap()
         if not data:
-            print("❌ Failed to fetch data from TaoMarketCap")
-            return 1
-        
-        # Create markdown
-        markdown_content = create_markdown_snapshot(data)
-        if not markdown_content:
-            print("❌ Failed to create markdown content")
+            logger.error("❌ Failed to fetch data from TaoMarketCap")
             return 1
         
-        # Save snapshot
-        file_path = save_snapshot(markdown_content)
+        # Save snapshot (markdown is streamed straight to the file)
+        file_path = save_snapshot(data)
         if not file_path:
-            print("❌ Failed to save snapshot")
+            logger.error("❌ Failed to save snapshot")
             return 1
         
+        # Skip the upload when the data matches what was last uploaded
+        digest = snapshot_hash(data)
+        if digest == read_last_hash():
+            logger.info("⏭️ Subnet data unchanged since last upload, skipping upload")
+            return 0
+        
         # Upload to vector store
         upload_success = upload_to_vector_store(file_path)
         if not upload_success:
-            print("❌ Failed to upload to vector store")
+            logger.error("❌ Failed to upload to vector store")
             return 1
+        write_last_hash(digest)
         
-        print("\n🎉 TaoMarketCap snapshot completed successfully!")
-        print(f"📁 Snapshot saved: {file_path}")
-        print(f"🔗 Vector store: {VECTOR_STORE_ID}")
+        logger.info("\n🎉 TaoMarketCap snapshot completed successfully!")
+        logger.info("📁 Snapshot saved: %s", file_path)
+        logger.info("🔗 Vector store: %s", VECTOR_STORE_ID)
         
         return 0
         
     except Exception as e:
-        print(f"💥 Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("💥 Unexpected error: %s", e)
         return 1
 
 if __name__ == "__main__":
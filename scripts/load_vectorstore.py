@@ -0,0 +1,23 @@
+from pathlib import Path
+import orjson
+import faiss
+
+INDEX_PATH = "vector/index.faiss"
+META_PATH = Path("vector/meta.json")
+
+def load():
+    """Open the profile index read-only; returns (index, files).
+
+    Flat indexes are opened with IO_FLAG_MMAP_IFC, which maps their codes
+    from the file so vectors are paged in from the OS page cache on demand.
+    IVF inverted lists map with IO_FLAG_MMAP. Anything else is read into RAM.
+    """
+    meta = orjson.loads(META_PATH.read_bytes())
+    if not meta.get("mmap_safe"):
+        flags = 0
+    elif meta.get("index_type", "").startswith("IndexFlat"):
+        # IO_FLAG_MMAP alone still copies IndexFlat* codes into RAM
+        flags = faiss.IO_FLAG_MMAP_IFC
+    else:
+        flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+    return faiss.read_index(INDEX_PATH, flags), meta["files"]
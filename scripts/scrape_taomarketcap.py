@@ -1,7 +1,7 @@
-import json
-import requests
+import orjson
 from pathlib import Path
 import time
+from taomc_common import API_SUBNETS_URL, SESSION
 
 # Output file
 OUT = Path("data/subnets.json")
@@ -9,16 +9,14 @@ OUT = Path("data/subnets.json")
 def main():
     print("Fetching subnet data from TaoMarketCap API...")
     # TaoMarketCap uses a JSON API endpoint that returns subnet info.
-    # It may change paths occasionally, but this endpoint is live as of now:
-    url = "https://taomarketcap.com/api/subnets"
-
-    response = requests.get(url, timeout=30)
+    # It may change paths occasionally, see API_SUBNETS_URL in taomc_common.
+    response = SESSION.get(API_SUBNETS_URL, timeout=30)
     if response.status_code != 200:
         print(f"Error fetching data: {response.status_code}")
-        OUT.write_text(json.dumps({"subnets": [], "timestamp": int(time.time())}, indent=2))
+        OUT.write_bytes(orjson.dumps({"subnets": [], "timestamp": int(time.time())}, option=orjson.OPT_INDENT_2))
         return
 
-    data = response.json()
+    data = orjson.loads(response.content)
 
     # Convert data into our preferred format
     subnets = []
@@ -33,7 +31,7 @@ def main():
         })
 
     # Save results
-    OUT.write_text(json.dumps({"subnets": subnets, "timestamp": int(time.time())}, indent=2))
+    OUT.write_bytes(orjson.dumps({"subnets": subnets, "timestamp": int(time.time())}, option=orjson.OPT_INDENT_2))
     print(f"Fetched and saved {len(subnets)} subnets.")
 
 if __name__ == "__main__":
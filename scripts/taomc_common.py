@@ -0,0 +1,62 @@
+"""
+Shared TaoMarketCap HTTP plumbing.
+
+Used by fetch_taomarketcap_snapshot.py and scrape_taomarketcap.py so both
+scrapers send the same headers through one keep-alive, retrying session.
+"""
+
+import logging
+import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger("taomc")
+
+# JSON endpoint listing every subnet; cheaper than scraping the HTML page
+API_SUBNETS_URL = "https://taomarketcap.com/api/subnets"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    # gzip/deflate plus br and zstd when brotli/zstandard are installed:
+    # only advertise encodings urllib3 can actually decode
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+# Seconds to reuse cached TaoMarketCap responses from disk (0 disables).
+# Meant for local reruns; keep it below the cron interval in production.
+CACHE_TTL = int(os.getenv("TAOMC_CACHE_TTL", "0"))
+HTTP_CACHE = "data/.http_cache"
+
+def create_session():
+    """Create the shared keep-alive session, disk-cached when CACHE_TTL is set."""
+    if CACHE_TTL > 0:
+        from requests_cache import CachedSession
+        session = CachedSession(HTTP_CACHE, backend="sqlite", expire_after=CACHE_TTL,
+                                allowable_methods=["GET"])
+    else:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        # raise_on_status=False hands the last 5xx back so callers see the status
+        max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504],
+                          raise_on_status=False)
+    ))
+    return session
+
+# Shared session for every TaoMarketCap request
+SESSION = create_session()
+
+def fetch_page(url, label="TaoMarketCap"):
+    """GET url through SESSION; return the response, or None after reporting the error."""
+    try:
+        resp = SESSION.get(url, timeout=30)
+        resp.raise_for_status()
+        logger.info("✅ Successfully fetched %s (status: %s)", label, resp.status_code)
+        return resp
+    except Exception as e:
+        logger.error("❌ Error fetching %s: %s", label, e)
+        return None
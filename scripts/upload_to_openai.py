@@ -8,61 +8,72 @@ and uploads the consolidated profiles to a file search or vector store.
 """
 
 import os
+import datetime
 import json
-import tempfile
+import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from openai import OpenAI
 from typing import Optional
 
+# Threads used to read profile files in consolidate_profiles
+READ_WORKERS = 16
+
 def get_openai_client() -> OpenAI:
     """Initialize OpenAI client with API key from environment."""
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable is required")
     
-    return OpenAI(api_key=api_key)
+    # The SDK retries 408/409/429/5xx with jittered exponential backoff
+    return OpenAI(api_key=api_key, max_retries=5)
+
+def read_profile(path: str) -> str:
+    """Read one profile as text."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
 
-def consolidate_profiles() -> str:
-    """Consolidate all subnet profiles into a single text file."""
+def consolidate_profiles(out) -> int:
+    """Stream all subnet profiles into the open text file out; return the profile count."""
     profiles_dir = Path("data/profiles")
     
     if not profiles_dir.exists():
         raise FileNotFoundError("data/profiles directory not found. Run build_profiles_local.py first.")
     
-    consolidated_content = []
-    consolidated_content.append("# Bittensor Subnet Profiles\n")
-    consolidated_content.append(f"Generated on: {os.popen('date').read().strip()}\n")
-    consolidated_content.append(f"Total profiles: {len(list(profiles_dir.glob('*.md')))}\n")
-    consolidated_content.append("=" * 80 + "\n\n")
+    # Sort profile files by subnet ID; one scandir pass, and sorted() computes
+    # each key once, so filenames are parsed a single time
+    with os.scandir(profiles_dir) as it:
+        profile_files = sorted((e.path for e in it if e.name.endswith(".md") and e.is_file()),
+                               key=lambda path: int(os.path.basename(path)[:-3].split('_')[0]))
+    separator = "=" * 80
     
-    # Sort profile files by subnet ID
-    profile_files = sorted(profiles_dir.glob("*.md"), key=lambda x: int(x.stem.split('_')[0]))
+    out.write("# Bittensor Subnet Profiles\n\n")
+    generated = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    out.write(f"Generated on: {generated}\n\n")
+    out.write(f"Total profiles: {len(profile_files)}\n\n")
+    out.write(separator + "\n\n")
     
-    for profile_file in profile_files:
-        with open(profile_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        consolidated_content.append(content)
-        consolidated_content.append("\n" + "=" * 80 + "\n\n")
+    # Read profiles on a thread pool (map keeps subnet order) and write each
+    # one out as soon as it and everything before it has arrived
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        for content in pool.map(read_profile, profile_files):
+            out.write("\n")
+            out.write(content)
+            out.write(f"\n\n{separator}\n\n")
     
-    return "\n".join(consolidated_content)
+    return len(profile_files)
 
-def upload_to_openai(content: str, filename: str = "bittensor_subnet_profiles.txt") -> Optional[str]:
-    """Upload content to OpenAI file search."""
+def upload_to_openai(content: bytes, filename: str = "bittensor_subnet_profiles.txt") -> Optional[str]:
+    """Upload consolidated profile bytes to OpenAI file search."""
     client = get_openai_client()
     
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as temp_file:
-        temp_file.write(content)
-        temp_file_path = temp_file.name
-    
     try:
         print(f"Uploading {filename} to OpenAI...")
         
-        # Upload file to OpenAI
-        with open(temp_file_path, 'rb') as f:
+        # Upload straight from memory; no temporary file on disk
+        with io.BytesIO(content) as f:
             uploaded_file = client.files.create(
-                file=f,
+                file=(filename, f),
                 purpose="file-search"  # Use file-search for AI agent access
             )
         
@@ -75,16 +86,11 @@ def upload_to_openai(content: str, filename: str = "bittensor_subnet_profiles.tx
     except Exception as e:
         print(f"❌ Error uploading to OpenAI: {e}")
         return None
-    
-    finally:
-        # Clean up temporary file
-        os.unlink(temp_file_path)
 
-def list_existing_files():
-    """List existing files in OpenAI account."""
+def list_existing_files(pending=None):
+    """List existing files in OpenAI account, optionally from an in-flight files.list() future."""
     try:
-        client = get_openai_client()
-        files = client.files.list()
+        files = pending.result() if pending is not None else get_openai_client().files.list()
         
         print("\n📋 Existing files in your OpenAI account:")
         for file in files.data:
@@ -108,20 +114,29 @@ def main():
             print("❌ No subnet data found. Please run fetch_subnets_bt.py first.")
             return
         
-        # Consolidate profiles
-        print("📝 Consolidating subnet profiles...")
-        consolidated_content = consolidate_profiles()
-        
-        # Show preview
-        print(f"📊 Consolidated content length: {len(consolidated_content)} characters")
-        print(f"📄 Preview (first 200 chars):")
-        print(consolidated_content[:200] + "..." if len(consolidated_content) > 200 else consolidated_content)
-        
-        # List existing files
-        list_existing_files()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Start the file listing round trip while the profiles are read from disk
+            pending = pool.submit(lambda: get_openai_client().files.list())
+            
+            # Consolidate profiles straight into an in-memory buffer
+            print("📝 Consolidating subnet profiles...")
+            buf = io.BytesIO()
+            with io.TextIOWrapper(buf, encoding='utf-8') as out:
+                count = consolidate_profiles(out)
+                out.flush()
+                content = buf.getvalue()
+            
+            # Show preview
+            preview = content[:1000].decode('utf-8', 'ignore')
+            print(f"📊 Consolidated {count} profiles ({len(content)} bytes)")
+            print(f"📄 Preview (first 200 chars):")
+            print(preview[:200] + "..." if len(preview) > 200 else preview)
+            
+            # List existing files
+            list_existing_files(pending)
         
         # Upload to OpenAI
-        file_id = upload_to_openai(consolidated_content)
+        file_id = upload_to_openai(content)
         
         if file_id:
             print(f"\n🎉 Upload completed successfully!")
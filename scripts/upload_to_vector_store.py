@@ -58,7 +58,8 @@ def main():
                 from openai import OpenAI
                 print("✅ Successfully imported new OpenAI client")
                 
-                client = OpenAI(api_key=api_key)
+                # The SDK retries 408/409/429/5xx with jittered exponential backoff
+                client = OpenAI(api_key=api_key, max_retries=5)
                 print("✅ Created OpenAI client")
                 
                 # Test basic functionality
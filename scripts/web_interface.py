@@ -6,13 +6,23 @@ A simple web interface to view subnet data and profiles locally.
 Run this script and visit http://localhost:8000 to view the subnet information.
 """
 
-import json
+from concurrent.futures import ProcessPoolExecutor
+import datetime
+import email.utils
+import gzip
+import hashlib
+import io
+import orjson
 import os
+import re
+import shutil
+import stat
 from pathlib import Path
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 import webbrowser
-import threading
 import time
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import Markup, escape
 
 # File paths
 SUBNETS_JSON = Path("data/subnets.json")
@@ -20,283 +30,111 @@ PROFILES_DIR = Path("data/profiles")
 OUTPUT_DIR = Path("web_output")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-def create_index_html():
-    """Create the main index.html file for the web interface."""
+# Page templates are compiled once per process (and cached as bytecode across runs)
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+JINJA_CACHE = Path(".jinja_cache")
+JINJA_CACHE.mkdir(exist_ok=True)
+_ENV = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    # Subnet names, owners etc. come from chain/scraped data: escape them on output
+    autoescape=select_autoescape(["html", "j2"]),
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    bytecode_cache=FileSystemBytecodeCache(str(JINJA_CACHE)),
+)
+
+# Shared stylesheet, copied into OUTPUT_DIR; pages link it with ?v=<hash> so
+# it can be cached as immutable and still refresh when it changes
+STYLE_CSS = TEMPLATES_DIR / "style.css"
+CSS_VERSION = hashlib.sha1(STYLE_CSS.read_bytes()).hexdigest()[:10]
+
+# Fewer stale profiles than this are converted in-process
+PARALLEL_MIN = 32
+
+# Profile pages are rebuilt when their Markdown or this render version changes.
+# Both are content hashes: mtimes are reset by git checkout, which would make
+# stale pages look newer than their sources.
+RENDER_VERSION = hashlib.sha1(b"".join(
+    p.read_bytes() for p in (Path(__file__), TEMPLATES_DIR / "profile.html.j2", STYLE_CSS)
+)).hexdigest()
+# {"render": RENDER_VERSION, "files": {name.md: sha1 of its Markdown}} for the pages on disk
+PROFILE_MANIFEST = OUTPUT_DIR / "profiles" / ".manifest.json"
+
+# Markdown patterns used by create_profile_html
+_HEADER_RE = re.compile(r'^(#{1,3}) (.+)$')
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_CODE_RE = re.compile(r'`([^`]+)`')
+
+def _header_html(match):
+    level = len(match.group(1))
+    return f'<h{level}>{match.group(2)}</h{level}>'
+
+# Parsed subnets.json, reused while the file's mtime is unchanged
+_JSON_CACHE = {}
+
+def load_subnets():
+    """Return the parsed subnets.json, re-reading it only when it changed on disk."""
+    mtime = SUBNETS_JSON.stat().st_mtime
+    if _JSON_CACHE.get("mtime") != mtime:
+        _JSON_CACHE.update(mtime=mtime, data=orjson.loads(SUBNETS_JSON.read_bytes()))
+    return _JSON_CACHE["data"]
+
+def load_manifest():
+    """Return {name.md: sha1} for profile pages rendered by the current RENDER_VERSION."""
+    try:
+        manifest = orjson.loads(PROFILE_MANIFEST.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+    if manifest.get("render") != RENDER_VERSION:
+        return {}
+    return manifest.get("files", {})
+
+def write_index_html(fp):
+    """Write the main index.html page for the web interface to fp."""
     
     # Read subnet data
     if not SUBNETS_JSON.exists():
-        return create_error_html("No subnet data found. Please run 'python scripts/fetch_subnets_bt.py' first.")
-    
-    with open(SUBNETS_JSON, 'r') as f:
-        data = json.load(f)
+        fp.write(create_error_html("No subnet data found. Please run 'python scripts/fetch_subnets_bt.py' first."))
+        return
     
+    data = load_subnets()
     subnets = data.get("subnets", [])
     
-    # Create HTML content
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Bittensor Subnet Updater</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: 300;
-        }}
-        .header p {{
-            margin: 10px 0 0 0;
-            opacity: 0.9;
-        }}
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            padding: 30px;
-            background: #f8f9fa;
-        }}
-        .stat-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .stat-number {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        .stat-label {{
-            color: #666;
-            margin-top: 5px;
-        }}
-        .subnets-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            padding: 30px;
-        }}
-        .subnet-card {{
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 20px;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        .subnet-card:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }}
-        .subnet-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }}
-        .subnet-id {{
-            font-size: 1.2em;
-            font-weight: bold;
-            color: #333;
-        }}
-        .status {{
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 0.8em;
-            font-weight: bold;
-        }}
-        .status.active {{
-            background: #d4edda;
-            color: #155724;
-        }}
-        .status.inactive {{
-            background: #f8d7da;
-            color: #721c24;
-        }}
-        .status.unknown {{
-            background: #fff3cd;
-            color: #856404;
-        }}
-        .subnet-info {{
-            font-size: 0.9em;
-            color: #666;
-        }}
-        .subnet-info div {{
-            margin: 5px 0;
-        }}
-        .price {{
-            font-weight: bold;
-            color: #28a745;
-        }}
-        .owner {{
-            font-family: monospace;
-            font-size: 0.8em;
-            word-break: break-all;
-        }}
-        .view-profile {{
-            margin-top: 15px;
-        }}
-        .view-profile a {{
-            display: inline-block;
-            padding: 8px 16px;
-            background: #667eea;
-            color: white;
-            text-decoration: none;
-            border-radius: 4px;
-            font-size: 0.9em;
-            transition: background 0.2s;
-        }}
-        .view-profile a:hover {{
-            background: #5a6fd8;
-        }}
-        .footer {{
-            text-align: center;
-            padding: 20px;
-            color: #666;
-            border-top: 1px solid #e0e0e0;
-        }}
-        .refresh-btn {{
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            background: #28a745;
-            color: white;
-            border: none;
-            padding: 12px 20px;
-            border-radius: 25px;
-            cursor: pointer;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-            font-size: 0.9em;
-        }}
-        .refresh-btn:hover {{
-            background: #218838;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Bittensor Subnet Updater</h1>
-            <p>Live subnet data from the Bittensor blockchain</p>
-        </div>
-        
-        <div class="stats">
-            <div class="stat-card">
-                <div class="stat-number">{len(subnets)}</div>
-                <div class="stat-label">Total Subnets</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{sum(1 for s in subnets if s.get('is_active') is True)}</div>
-                <div class="stat-label">Active Subnets</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{sum(1 for s in subnets if s.get('is_active') is False)}</div>
-                <div class="stat-label">Inactive Subnets</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{data.get('timestamp', 'N/A')}</div>
-                <div class="stat-label">Last Updated</div>
-            </div>
-        </div>
-        
-        <div class="subnets-grid">
-"""
-    
-    # Add subnet cards
+    # Header counts in a single pass; subnets with no is_active value count as neither
+    active = inactive = 0
     for subnet in subnets:
-        subnet_id = subnet.get("id", "Unknown")
-        name = subnet.get("name", f"Subnet {subnet_id}")
-        is_active = subnet.get("is_active")
-        price = subnet.get("price", 0)
-        owner = subnet.get("owner_hotkey", "Unknown")
-        
-        # Determine status
-        if is_active is True:
-            status_class = "active"
-            status_text = "✅ Active"
-        elif is_active is False:
-            status_class = "inactive"
-            status_text = "⚠️ Inactive"
-        else:
-            status_class = "unknown"
-            status_text = "🔄 Unknown"
-        
-        html_content += f"""
-            <div class="subnet-card">
-                <div class="subnet-header">
-                    <div class="subnet-id">{name}</div>
-                    <div class="status {status_class}">{status_text}</div>
-                </div>
-                <div class="subnet-info">
-                    <div><strong>ID:</strong> {subnet_id}</div>
-                    <div><strong>Price:</strong> <span class="price">{price:.6f} TAO</span></div>
-                    <div><strong>Owner:</strong> <span class="owner">{owner}</span></div>
-                    <div><strong>Exists:</strong> {subnet.get('exists', 'Unknown')}</div>
-                </div>
-                <div class="view-profile">
-                    <a href="profiles/{subnet_id}_subnet-{subnet_id}.html" target="_blank">View Profile</a>
-                </div>
-            </div>
-"""
+        is_active = subnet.get('is_active')
+        active += is_active is True
+        inactive += is_active is False
+    stats = {"total": len(subnets), "active": active, "inactive": inactive}
     
-    html_content += """
-        </div>
-        
-        <div class="footer">
-            <p>Data source: Bittensor Subtensor SDK (Finney network) - Public data only</p>
-            <p>Generated on: """ + time.strftime('%Y-%m-%d %H:%M:%S') + """</p>
-        </div>
-    </div>
-    
-    <button class="refresh-btn" onclick="location.reload()">🔄 Refresh Data</button>
-</body>
-</html>
-"""
-    
-    return html_content
+    # Stream the rendered chunks (header, one per card, footer) straight into fp
+    # instead of building the whole page as one string first
+    _ENV.get_template("index.html.j2").stream(
+        subnets=subnets,
+        data=data,
+        stats=stats,
+        css_version=CSS_VERSION,
+        generated=time.strftime('%Y-%m-%d %H:%M:%S'),
+    ).dump(fp)
 
 def create_profile_html(subnet_id, profile_content):
     """Convert Markdown profile to HTML."""
     
-    # Better Markdown to HTML conversion
-    html_content = profile_content
-    
-    # Convert headers
-    html_content = html_content.replace('# ', '<h1>').replace('\n', '</h1>\n', 1)
-    html_content = html_content.replace('## ', '<h2>').replace('\n', '</h2>\n')
-    html_content = html_content.replace('### ', '<h3>').replace('\n', '</h3>\n')
-    
-    # Convert bold text (handle multiple instances)
-    import re
-    html_content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', html_content)
-    
-    # Convert lists - wrap in <ul> tags
-    lines = html_content.split('\n')
+    # One pass over the lines converts headers, bold text and inline code,
+    # wraps lists in <ul> tags and other text lines in <p>
     in_list = False
     result_lines = []
     
-    for line in lines:
+    # Escape the Markdown text once up front; only the tags added below are raw HTML
+    for line in str(escape(profile_content)).split('\n'):
+        if line.startswith('#'):
+            line = _HEADER_RE.sub(_header_html, line)
+        if '**' in line:
+            line = _BOLD_RE.sub(r'<strong>\1</strong>', line)
+        if '`' in line:
+            line = _CODE_RE.sub(r'<code>\1</code>', line)
         if line.strip().startswith('- '):
             if not in_list:
                 result_lines.append('<ul>')
@@ -306,6 +144,9 @@ def create_profile_html(subnet_id, profile_content):
             if in_list:
                 result_lines.append('</ul>')
                 in_list = False
+            # Block elements break lines on their own; plain text gets a <p>
+            if line and not line.startswith('<h'):
+                line = f'<p>{line}</p>'
             result_lines.append(line)
     
     if in_list:
@@ -313,120 +154,47 @@ def create_profile_html(subnet_id, profile_content):
     
     html_content = '\n'.join(result_lines)
     
-    # Convert code blocks
-    html_content = html_content.replace('`', '<code>').replace('`', '</code>')
-    
-    # Convert line breaks
-    html_content = html_content.replace('\n', '<br>\n')
-    
     # Wrap in HTML structure
-    full_html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Subnet {subnet_id} Profile</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 800px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            padding: 30px;
-        }}
-        h1 {{ color: #333; border-bottom: 2px solid #667eea; padding-bottom: 10px; }}
-        h2 {{ color: #555; margin-top: 30px; }}
-        h3 {{ color: #666; }}
-        code {{ background: #f8f9fa; padding: 2px 4px; border-radius: 3px; font-family: monospace; }}
-        ul {{ margin: 10px 0; padding-left: 20px; }}
-        li {{ margin: 5px 0; }}
-        .back-btn {{
-            display: inline-block;
-            margin-bottom: 20px;
-            padding: 8px 16px;
-            background: #667eea;
-            color: white;
-            text-decoration: none;
-            border-radius: 4px;
-        }}
-        .back-btn:hover {{ background: #5a6fd8; }}
-        .placeholder {{ 
-            color: #999; 
-            font-style: italic; 
-            background: #f8f9fa; 
-            padding: 2px 4px; 
-            border-radius: 3px; 
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <a href="../index.html" class="back-btn">← Back to Subnet List</a>
-        {html_content}
-    </div>
-</body>
-</html>
-"""
-    
-    return full_html
+    return _ENV.get_template("profile.html.j2").render(subnet_id=subnet_id, content=Markup(html_content),
+                                                       css_version=CSS_VERSION)
 
 def create_error_html(message):
     """Create an error page."""
-    return f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Error - Bittensor Subnet Updater</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            min-height: 100vh;
-        }}
-        .error-container {{
-            background: white;
-            padding: 40px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            text-align: center;
-            max-width: 500px;
-        }}
-        h1 {{ color: #dc3545; }}
-        p {{ color: #666; margin: 20px 0; }}
-        .code {{
-            background: #f8f9fa;
-            padding: 10px;
-            border-radius: 4px;
-            font-family: monospace;
-            margin: 20px 0;
-        }}
-    </style>
-</head>
-<body>
-    <div class="error-container">
-        <h1>⚠️ Error</h1>
-        <p>{message}</p>
-        <div class="code">python scripts/fetch_subnets_bt.py</div>
-        <p>Then refresh this page.</p>
-    </div>
-</body>
-</html>
-"""
+    return _ENV.get_template("error.html.j2").render(message=message, css_version=CSS_VERSION)
+
+def write_gzip(path, data):
+    """Write data gzip-compressed next to path as <path>.gz for CachingHandler to serve."""
+    with open(f"{path}.gz", 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=6, mtime=0))
+
+def open_gzip_text(path):
+    """Open <path>.gz for streaming UTF-8 text into, compressed like write_gzip."""
+    return io.TextIOWrapper(gzip.GzipFile(f"{path}.gz", 'wb', compresslevel=6, mtime=0), encoding='utf-8')
+
+class _Tee:
+    """Minimal writable that forwards every write to several text files."""
+    
+    def __init__(self, *files):
+        self.files = files
+    
+    def write(self, text):
+        for f in self.files:
+            f.write(text)
+
+def _convert_one(name, profile_content):
+    """Convert one Markdown profile (file name in PROFILES_DIR, text) into its page under OUTPUT_DIR/profiles."""
+    # Extract subnet ID from filename
+    stem = name[:-len(".md")]
+    subnet_id = stem.partition('_')[0]
+    
+    # Convert to HTML
+    html_content = create_profile_html(subnet_id, profile_content)
+    
+    # Save HTML file in profiles subdirectory, plus its precompressed copy
+    html_path = OUTPUT_DIR / "profiles" / (stem + ".html")
+    with open(html_path, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+    write_gzip(html_path, html_content.encode())
 
 def generate_web_files():
     """Generate all web files."""
@@ -436,47 +204,191 @@ def generate_web_files():
     profiles_output_dir = OUTPUT_DIR / "profiles"
     profiles_output_dir.mkdir(exist_ok=True)
     
-    # Create main index.html
-    index_html = create_index_html()
-    with open(OUTPUT_DIR / "index.html", 'w') as f:
-        f.write(index_html)
+    # Copy the shared stylesheet when its content changed
+    css = STYLE_CSS.read_bytes()
+    css_out = OUTPUT_DIR / "style.css"
+    if not css_out.exists() or css_out.read_bytes() != css:
+        shutil.copyfile(STYLE_CSS, css_out)
+        write_gzip(css_out, css)
     
-    # Convert profile files to HTML
+    # Create main index.html, streaming the same chunks into index.html.gz.
+    # The .gz is opened first so it closes last and is never older than the page.
+    with open_gzip_text(OUTPUT_DIR / "index.html") as gz, \
+            open(OUTPUT_DIR / "index.html", 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write_index_html(_Tee(f, gz))
+    
+    # Convert profile files to HTML, skipping profiles whose page was already
+    # rendered from the same Markdown by the same RENDER_VERSION. One scandir
+    # pass: DirEntry carries the name and path without building a Path per file.
     if PROFILES_DIR.exists():
-        for profile_file in PROFILES_DIR.glob("*.md"):
-            with open(profile_file, 'r') as f:
-                profile_content = f.read()
-            
-            # Extract subnet ID from filename
-            subnet_id = profile_file.stem.split('_')[0]
-            
-            # Convert to HTML
-            html_content = create_profile_html(subnet_id, profile_content)
-            
-            # Save HTML file in profiles subdirectory
-            html_filename = profile_file.stem + ".html"
-            with open(profiles_output_dir / html_filename, 'w') as f:
-                f.write(html_content)
+        rendered = load_manifest()
+        hashes, pending = {}, []
+        with os.scandir(PROFILES_DIR) as it:
+            for entry in it:
+                if not (entry.name.endswith(".md") and entry.is_file()):
+                    continue
+                with open(entry.path, 'rb') as f:
+                    raw = f.read()
+                digest = hashlib.sha1(raw).hexdigest()
+                hashes[entry.name] = digest
+                html_path = profiles_output_dir / (entry.name[:-len(".md")] + ".html")
+                if rendered.get(entry.name) != digest or not html_path.exists():
+                    pending.append((entry.name, raw.decode("utf-8")))
+        
+        names = [name for name, _ in pending]
+        contents = [content for _, content in pending]
+        if len(pending) >= PARALLEL_MIN:
+            # Each page is independent and CPU-bound on regex/string work
+            with ProcessPoolExecutor() as pool:
+                list(pool.map(_convert_one, names, contents, chunksize=16))
+        else:
+            # Too few pages to pay for starting worker processes
+            for name, content in pending:
+                _convert_one(name, content)
+        PROFILE_MANIFEST.write_bytes(orjson.dumps({"render": RENDER_VERSION, "files": hashes},
+                                                  option=orjson.OPT_INDENT_2))
     
     print(f"Web interface generated in {OUTPUT_DIR}/")
     print("Files created:")
     print(f"  - index.html")
+    print(f"  - style.css")
     if profiles_output_dir.exists():
         for file in profiles_output_dir.glob("*.html"):
             print(f"  - profiles/{file.name}")
 
+def accepts_gzip(accept_encoding):
+    """True when an Accept-Encoding header allows gzip, honouring q-values ("gzip;q=0" refuses it)."""
+    qvalues = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+    # An explicit gzip (or its x-gzip alias) entry wins over the * wildcard
+    for coding in ('gzip', 'x-gzip', '*'):
+        if coding in qvalues:
+            return qvalues[coding] > 0
+    return False
+
+class CachingHandler(SimpleHTTPRequestHandler):
+    """Static file handler with Cache-Control, ETag and 304 Not Modified support."""
+    
+    def send_head(self):
+        self._etag = None
+        self._vary = False
+        path = self.translate_path(self.path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return super().send_head()
+        if stat.S_ISDIR(st.st_mode):
+            # "/" is what start_server opens: serve its index.html through the
+            # gzip/ETag path below; redirects and listings stay with the base class
+            index = os.path.join(path, "index.html")
+            if not self.path.split('?', 1)[0].endswith('/') or not os.path.isfile(index):
+                return super().send_head()
+            path = index
+            st = os.stat(path)
+        
+        # Serve the precompressed <file>.gz written by generate_web_files when
+        # the client takes gzip; a .gz older than the file is stale and ignored
+        gz_path = path + ".gz"
+        use_gzip = False
+        try:
+            if os.stat(gz_path).st_mtime >= st.st_mtime:
+                self._vary = True
+                use_gzip = accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        except OSError:
+            pass
+        
+        self._etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}{"-gz" if use_gzip else ""}"'
+        if self._not_modified(st):
+            # Same file the browser already has: headers only, no body
+            self.send_response(304)
+            self.end_headers()
+            return None
+        if not use_gzip:
+            return super().send_head()
+        
+        f = open(gz_path, 'rb')
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+            self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+            self.end_headers()
+            return f
+        except:
+            f.close()
+            raise
+    
+    def _not_modified(self, st):
+        """Check If-None-Match, then If-Modified-Since, against the file's stat."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            return self._etag in (tag.strip() for tag in if_none_match.split(',')) or if_none_match.strip() == '*'
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if not if_modified_since:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=datetime.timezone.utc)
+        # HTTP dates have one-second resolution
+        return int(st.st_mtime) <= since.timestamp()
+    
+    def copyfile(self, source, outputfile):
+        # socket.sendfile uses os.sendfile (kernel-side copy) for the real files
+        # from send_head, and falls back to send() for BytesIO bodies such as
+        # directory listings
+        self.connection.sendfile(source)
+    
+    def send_response_only(self, code, message=None):
+        # Remembered so end_headers only adds caching headers to successful responses
+        self._status = code
+        super().send_response_only(code, message)
+    
+    def end_headers(self):
+        if getattr(self, '_etag', None):
+            self.send_header("ETag", self._etag)
+        if getattr(self, '_vary', False):
+            self.send_header("Vary", "Accept-Encoding")
+        # Only successful responses are cacheable; errors and redirects get no Cache-Control
+        path = self.path.split('?', 1)[0]
+        if getattr(self, '_status', None) in (200, 304):
+            if path.endswith(('.css', '.js')):
+                # Versioned by ?v=<hash>, so the browser never needs to revalidate
+                self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+            elif path.endswith('.html') or path.endswith('/'):
+                self.send_header("Cache-Control", "public, max-age=60")
+        super().end_headers()
+
 def start_server():
     """Start the local web server."""
     os.chdir(OUTPUT_DIR)
     
     server_address = ('', 8000)
-    httpd = HTTPServer(server_address, SimpleHTTPRequestHandler)
+    # One thread per request so the browser's parallel fetches are served in parallel
+    httpd = ThreadingHTTPServer(server_address, CachingHandler)
     
     print(f"\n🌐 Web interface is running at: http://localhost:8000")
     print("Press Ctrl+C to stop the server")
     
-    # Open browser automatically
-    threading.Timer(1.0, lambda: webbrowser.open('http://localhost:8000')).start()
+    # The socket is already bound and listening, so the browser's request
+    # just waits in the backlog until serve_forever picks it up
+    webbrowser.open('http://localhost:8000')
     
     try:
         httpd.serve_forever()